@@ -20,7 +20,11 @@ Edge cases:
 - Negative values for 'period' or 'amountgel'.
 """
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import multiprocessing as mp
+import os
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -30,115 +34,475 @@ import pandas as pd
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sending applicants to worker processes and their results back is pickled in the
+# parent, which costs roughly 40% of the serial run time. The pool only pays off
+# with at least 4 workers, and the pool start-up only pays off from ~20k applicants.
+_PARALLEL_MIN_WORKERS = 4
+_PARALLEL_MIN_APPLICANTS = 20_000
+# Up to this many transfers, plain Python is faster than building DataFrames
+_SMALL_CHUNK_MAX_TRANSFERS = 32
 
-def join_unique_sources(sources: pd.Series) -> str:
+# 'period' is stored as int64, so larger values (including infinity) are rejected as invalid
+_PERIOD_LIMIT = 2 ** 63
+
+# Transfer fields that are cleaned and aggregated; any other field only takes part in deduplication
+_TRANSFER_FIELDS = frozenset({'country', 'period', 'amountgel', 'source'})
+
+
+def _extra_fields_key(transfer: Dict[str, Any]) -> Optional[frozenset]:
     """
-    Join unique source values alphabetically with '/'.
+    Build a hashable key from the fields of a transfer other than the known ones.
+
+    Extra fields, such as a date or an ID, make otherwise identical transfers
+    distinct. Missing, empty or whitespace-only values are ignored, and
+    unhashable values are compared by their string form.
 
     Args:
-        sources: pandas Series of source values
+        transfer: Transfer dictionary
 
     Returns:
-        String of unique sources joined by '/'
+        Frozen set of (field, value) pairs, or None if there are no extra values
     """
-    return '/'.join(sorted(sources.unique()))
+    extra_fields = transfer.keys() - _TRANSFER_FIELDS
+    if not extra_fields:
+        return None
+
+    items = []
+    for field in extra_fields:
+        value = transfer[field]
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        if isinstance(value, str) and not value.strip():
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            value = str(value)
+        items.append((field, value))
+
+    return frozenset(items) or None
 
 
-def clean_and_validate_transfers(df: pd.DataFrame, applicant_id: str) -> Optional[pd.DataFrame]:
+def extract_transfer_columns(applicants: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
-    Clean and validate transfer data for a single applicant.
+    Extract the transfers of all applicants into one list per column.
+
+    Building the DataFrame from columns avoids hashing the keys of every
+    transfer dictionary, and missing keys simply become None. Any other
+    transfer fields are kept in a single 'extra_fields' column, so they
+    still count when removing duplicates. Label columns are object arrays,
+    so pandas keeps each raw value as it is instead of, for example,
+    turning a mix of 1 and 1.0 into floats.
 
     Args:
-        df: DataFrame containing transfer data
-        applicant_id: ID of the applicant for logging purposes
+        applicants: List of applicant dictionaries with their transfers
 
     Returns:
-        Cleaned DataFrame or None if no valid data remains
+        Dictionary mapping each column name to its values, including an
+        'applicant_idx' column with the applicant's position in the input list
     """
-    if df.empty:
-        return None
+    applicant_idxs, countries, periods, amounts, sources, extra_fields = [], [], [], [], [], []
+
+    for applicant_idx, applicant in enumerate(applicants):
+        for transfer in applicant.get('transfers') or []:
+            applicant_idxs.append(applicant_idx)
+            countries.append(transfer.get('country'))
+            periods.append(transfer.get('period'))
+            amounts.append(transfer.get('amountgel'))
+            sources.append(transfer.get('source'))
+            extra_fields.append(_extra_fields_key(transfer))
+
+    return {
+        'applicant_idx': applicant_idxs,
+        'country': np.fromiter(countries, dtype=object, count=len(countries)),
+        'period': periods,
+        'amountgel': amounts,
+        'source': np.fromiter(sources, dtype=object, count=len(sources)),
+        'extra_fields': extra_fields,
+    }
+
+
+def normalize_labels(labels: pd.Series, fill_value: Optional[str] = None) -> pd.Series:
+    """
+    Strip and uppercase string labels, such as countries or sources.
 
-    initial_rows = len(df)
+    Labels repeat a lot, so they are interned with pd.factorize first and
+    only the distinct values are normalized. The result is categorical, with
+    the categories sorted alphabetically, so later steps can work on its codes.
 
-    # Replace empty or whitespace-only strings with NaN
-    # \s*: Means zero or more whitespace characters (spaces, tabs, etc.)
-    df_cleaned = df.replace(r'^\s*$', np.nan, regex=True).copy()
+    Args:
+        labels: pandas Series of raw label values
+        fill_value: Label to use for missing, empty or whitespace-only values
 
-    # Remove rows with missing critical values ('country', 'period', 'amountgel')
-    df_cleaned = df_cleaned.dropna(subset=['country', 'period', 'amountgel'])
-    # Fill missing 'source' values with 'Unknown'
-    df_cleaned['source'] = df_cleaned['source'].fillna('Unknown')
+    Returns:
+        Categorical Series of normalized labels, with missing values as NaN unless fill_value is given
+    """
+    if pd.api.types.infer_dtype(labels, skipna=True) not in ('string', 'empty'):
+        # Convert non-string values, including unhashable ones such as lists, to their
+        # string form first; 1 and True would otherwise share a code when factorized
+        labels = labels.astype(str).where(labels.notna())
 
-    if df_cleaned.empty:
-        logger.warning(f'Applicant {applicant_id}: All rows removed due to missing critical data.')
-        return None
+    codes, uniques = pd.factorize(labels)
+    # The 'string' dtype runs the string methods as vectorized Arrow kernels when pyarrow is installed
+    normalized = pd.Series(uniques, dtype='string').str.strip().str.upper().replace('', pd.NA)
+    # Missing values have code -1, which points at this trailing missing value
+    normalized = pd.concat([normalized, pd.Series([pd.NA], dtype='string')], ignore_index=True)
+    if fill_value is not None:
+        normalized = normalized.fillna(fill_value)
 
-    # Convert data types
-    try:
-        df_cleaned['country'] = df_cleaned['country'].astype(str).str.upper().str.strip()
-        df_cleaned['period'] = pd.to_numeric(df_cleaned['period'], errors='coerce')
-        df_cleaned['amountgel'] = pd.to_numeric(df_cleaned['amountgel'], errors='coerce')
-        df_cleaned['source'] = df_cleaned['source'].astype(str).str.upper().str.strip()
+    # Labels that only differed before normalizing now share a code
+    label_codes, categories = pd.factorize(normalized, sort=True)
+    return pd.Series(pd.Categorical.from_codes(label_codes[codes], categories=categories), index=labels.index)
 
-        # Remove any rows where numeric conversion failed
-        df_cleaned = df_cleaned.dropna(subset=['period', 'amountgel'])
 
-        # Remove duplicates
-        df_cleaned = df_cleaned.drop_duplicates()
+def coerce_numbers(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to floats, with NaN for values that cannot be converted.
 
-        # Remove rows with logically invalid values ('period' or 'amountgel' < 0)
-        df_cleaned = df_cleaned[
-            (df_cleaned['period'] > 0) &
-            (df_cleaned['amountgel'] > 0)
-        ]
+    Numeric columns are cast directly. Any other column goes through
+    _to_number, the same conversion the pure-Python path uses, so both
+    paths accept exactly the same values.
 
-        if df_cleaned.empty:
-            logger.warning(f'Applicant {applicant_id}: All rows removed due to invalid data or business rules.')
-            return None
+    Args:
+        values: pandas Series of raw numeric values
 
-        # Convert 'period' and 'amountgel' to proper data types
-        df_cleaned['period'] = df_cleaned['period'].astype(int)
-        df_cleaned['amountgel'] = df_cleaned['amountgel'].astype(float)
+    Returns:
+        Series of floats
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float)
+    return values.map(_to_number).astype(float)
 
-        final_rows = len(df_cleaned)
-        removed_rows = initial_rows - final_rows
 
-        if removed_rows > 0:
-            logger.info(f'Applicant {applicant_id}: Removed {removed_rows} invalid row(s).')
+def clean_and_validate_transfers(df: pd.DataFrame, applicant_ids: List[str]) -> Optional[pd.DataFrame]:
+    """
+    Clean and validate transfer data for all applicants at once.
 
-        return df_cleaned
+    All validity rules are combined into a single boolean mask, so the
+    frame is filtered once instead of after every cleaning step. Errors are
+    left to the caller, which retries the applicants one at a time.
+    Applicants without any transfers are logged here too, so all messages
+    follow applicant order.
 
-    except Exception as error:
-        logger.error(f'Applicant {applicant_id}: Data cleaning failed - {str(error)}')
+    Args:
+        df: DataFrame containing transfer data, with an 'applicant_idx' column
+            pointing to the applicant's position in applicant_ids
+        applicant_ids: IDs of the applicants for logging purposes
+
+    Returns:
+        Cleaned DataFrame or None if no valid data remains
+    """
+    if df.empty:
+        for applicant_id in applicant_ids:
+            logger.info('Applicant %s: No transfer records found.', applicant_id)
+        return None
+
+    # Missing entire columns are treated the same way as missing values;
+    # any other columns are kept, since they make rows distinct when removing duplicates
+    missing_columns = [column for column in ('applicant_idx', *sorted(_TRANSFER_FIELDS)) if column not in df]
+    if missing_columns:
+        df = df.reindex(columns=[*df.columns, *missing_columns])
+    # Row counts for every applicant, including those without any transfers
+    initial_counts = df['applicant_idx'].value_counts().reindex(range(len(applicant_ids)), fill_value=0)
+
+    # Normalize strings; empty or whitespace-only strings become missing values
+    country = normalize_labels(df['country'])
+    # Fill missing 'source' values with 'UNKNOWN'
+    source = normalize_labels(df['source'], fill_value='UNKNOWN')
+    # Missing, empty and non-numeric values all become NaN
+    period = coerce_numbers(df['period'])
+    amountgel = coerce_numbers(df['amountgel'])
+
+    # Remove rows with missing critical values or logically invalid values
+    # ('period' or 'amountgel' <= 0, or a 'period' that does not fit in an int)
+    mask = country.notna() & (period > 0) & (period < _PERIOD_LIMIT) & (amountgel > 0)
+
+    df_cleaned = df.assign(
+        country=country,
+        period=period,
+        amountgel=amountgel,
+        source=source,
+    )[mask]
+
+    # Remove duplicates, then convert 'period' and 'amountgel' to proper data types
+    df_cleaned = df_cleaned.drop_duplicates().astype({'period': int, 'amountgel': float})
+
+    # A single count per applicant drives all log messages, since removing
+    # duplicates never removes the last row of an applicant
+    final_counts = df_cleaned['applicant_idx'].value_counts().reindex(initial_counts.index, fill_value=0)
+    removed_counts = initial_counts.sub(final_counts)
+    logged = (initial_counts == 0) | (removed_counts > 0)
+
+    for applicant_idx, initial_rows, removed_rows in zip(
+        initial_counts.index[logged], initial_counts[logged], removed_counts[logged]
+    ):
+        applicant_id = applicant_ids[applicant_idx]
+        if not initial_rows:
+            logger.info('Applicant %s: No transfer records found.', applicant_id)
+        elif removed_rows == initial_rows:
+            logger.warning('Applicant %s: All rows removed due to missing or invalid data.', applicant_id)
+        else:
+            logger.info('Applicant %s: Removed %s invalid row(s).', applicant_id, removed_rows)
+
+    if df_cleaned.empty:
         return None
 
-def group_and_aggregate_transfers(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    return df_cleaned
+
+def group_and_aggregate_transfers(df: pd.DataFrame) -> Dict[int, List[Dict[str, Any]]]:
     """
-    Group transfers by country and period, then aggregate amounts and sources.
+    Group transfers by applicant, country and period, then aggregate amounts and sources.
+
+    The rows are sorted by their keys with NumPy, so groups can be found without
+    building a pandas groupby. Amounts are summed with math.fsum, which is exact
+    and does not depend on the order of the rows. Countries and sources
+    are compared as integer codes and only turned back into strings for the output.
+    Errors are left to the caller, which retries the applicants one at a time.
 
     This function:
-        - Groups the cleaned transfer data by the ('country', 'period') pair.
+        - Groups the cleaned transfer data by the ('applicant_idx', 'country', 'period') triple.
         - Sums the 'amountgel' values for each group to get the total transferred amount.
         - Collects all unique 'source' values per group, sorts them alphabetically, and joins them with '/'.
 
     Args:
-        df: Cleaned DataFrame with transfer data
+        df: Cleaned DataFrame with transfer data for all applicants, with categorical
+            'country' and 'source' columns as returned by clean_and_validate_transfers
 
     Returns:
-        List of dictionaries containing grouped transfer records
+        Dictionary mapping each applicant index to its list of grouped transfer records
     """
-    try:
-        aggregated = df.groupby(['country', 'period']).agg(
-            amountgel=('amountgel', 'sum'),
-            source=('source', join_unique_sources)
+    # Work on the categorical codes instead of strings; the categories are sorted, so the codes are too
+    country, country_names = df['country'].cat.codes.to_numpy(), df['country'].cat.categories
+    source, source_names = df['source'].cat.codes.to_numpy(), df['source'].cat.categories
+    applicant_idx = df['applicant_idx'].to_numpy()
+    period = df['period'].to_numpy()
+    amountgel = df['amountgel'].to_numpy()
+
+    # Sort by the group keys, then by source, so every group is a contiguous
+    # run of rows with its sources in alphabetical order
+    order = np.lexsort((source, period, country, applicant_idx))
+    applicant_idx, country, period = applicant_idx[order], country[order], period[order]
+    amountgel, source = amountgel[order], source[order]
+
+    # Find the first row of every group and of every distinct source within a group
+    group_start = np.ones(len(order), dtype=bool)
+    group_start[1:] = (
+        (applicant_idx[1:] != applicant_idx[:-1]) |
+        (country[1:] != country[:-1]) |
+        (period[1:] != period[:-1])
+    )
+    source_start = group_start.copy()
+    source_start[1:] |= source[1:] != source[:-1]
+
+    starts = np.flatnonzero(group_start)
+    source_starts = np.flatnonzero(source_start)
+
+    unique_sources = source_names.take(source[source_starts]).tolist()
+    # Every group start is also a source start, so each group's unique sources are a slice
+    bounds = np.append(np.searchsorted(source_starts, starts), len(source_starts)).tolist()
+
+    group_sources = ['/'.join(unique_sources[begin:end]) for begin, end in zip(bounds, bounds[1:])]
+
+    amount_values = amountgel.tolist()
+    amount_bounds = np.append(starts, len(amount_values)).tolist()
+    amounts = [math.fsum(amount_values[begin:end]) for begin, end in zip(amount_bounds, amount_bounds[1:])]
+
+    # Emit the records straight from the column arrays
+    records = [
+        {'country': country_value, 'period': period_value, 'amountgel': amount, 'source': sources}
+        for country_value, period_value, amount, sources in zip(
+            country_names.take(country[starts]).tolist(),
+            period[starts].tolist(),
+            amounts,
+            group_sources,
         )
-        aggregated = aggregated.sort_values(['country', 'period']).reset_index()
+    ]
+
+    # Groups are sorted by applicant, so each applicant's records are a contiguous slice
+    group_applicants = applicant_idx[starts]
+    applicant_starts = np.flatnonzero(np.diff(group_applicants, prepend=-1))
+    applicant_bounds = np.append(applicant_starts, len(records)).tolist()
+
+    return {
+        applicant: records[begin:end]
+        for applicant, begin, end in zip(
+            group_applicants[applicant_starts].tolist(), applicant_bounds, applicant_bounds[1:]
+        )
+    }
+
+
+def _to_number(value: Any) -> float:
+    """
+    Convert a value to float, for both the pandas and the pure-Python paths.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        The value as a float, or NaN if it cannot be converted
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _normalize_label(label: Any) -> Optional[str]:
+    """
+    Strip and uppercase a single label, like normalize_labels does for a Series.
+
+    Args:
+        label: Raw label value
+
+    Returns:
+        Normalized label, or None if it is missing, empty or whitespace-only
+    """
+    if pd.api.types.is_scalar(label) and pd.isna(label):
+        return None
+    return str(label).strip().upper() or None
+
+
+def group_small_applicant_chunk(chunk: Tuple[List[Dict[str, Any]], List[str]]) -> List[List[Dict[str, Any]]]:
+    """
+    Clean, group and aggregate a small chunk of applicants in plain Python.
+
+    For a handful of transfers, building DataFrames costs far more than the
+    work itself. This applies the same rules as clean_and_validate_transfers
+    and group_and_aggregate_transfers, with dictionaries instead; the results
+    and log messages are identical (see test_coding_challenge.py).
+
+    Args:
+        chunk: Tuple of the applicant dictionaries and their IDs
+
+    Returns:
+        List of grouped transfer records for each applicant, in the same order
+    """
+    applicants, applicant_ids = chunk
+    grouped_transfers = []
+
+    for applicant_id, applicant in zip(applicant_ids, applicants):
+        try:
+            transfers = applicant.get('transfers') or []
+            if not transfers:
+                logger.info('Applicant %s: No transfer records found.', applicant_id)
+            # Unique (period, source, amountgel, extra fields) rows for each (country, period)
+            # group; a dict is used as an insertion-ordered set
+            rows_by_group = {}
+
+            for transfer in transfers:
+                country = _normalize_label(transfer.get('country'))
+                period = _to_number(transfer.get('period'))
+                amountgel = _to_number(transfer.get('amountgel'))
+
+                # Remove rows with missing critical values or logically invalid values
+                if country is None or not 0 < period < _PERIOD_LIMIT or not amountgel > 0:
+                    continue
+
+                # Fill missing 'source' values with 'UNKNOWN'
+                source = _normalize_label(transfer.get('source')) or 'UNKNOWN'
+                row = (period, source, amountgel, _extra_fields_key(transfer))
+                rows_by_group.setdefault((country, int(period)), {})[row] = None
+
+            removed_rows = len(transfers) - sum(len(rows) for rows in rows_by_group.values())
+            if transfers and not rows_by_group:
+                logger.warning('Applicant %s: All rows removed due to missing or invalid data.', applicant_id)
+            elif removed_rows > 0:
+                logger.info('Applicant %s: Removed %s invalid row(s).', applicant_id, removed_rows)
+
+            grouped_transfers.append([
+                {
+                    'country': country,
+                    'period': period,
+                    'amountgel': math.fsum(amountgel for _, _, amountgel, _ in rows),
+                    'source': '/'.join(sorted({source for _, source, _, _ in rows})),
+                }
+                for (country, period), rows in sorted(rows_by_group.items())
+            ])
+
+        except Exception as error:
+            logger.error('Applicant %s: Data processing failed - %s', applicant_id, error)
+            grouped_transfers.append([])
+
+    return grouped_transfers
 
-        return aggregated.to_dict('records')
 
+def group_batched_applicant_chunk(chunk: Tuple[List[Dict[str, Any]], List[str]]) -> List[List[Dict[str, Any]]]:
+    """
+    Clean, group and aggregate the transfers of a chunk of applicants in one pandas batch.
+
+    Args:
+        chunk: Tuple of the applicant dictionaries and their IDs
+
+    Returns:
+        List of grouped transfer records for each applicant, in the same order
+    """
+    applicants, applicant_ids = chunk
+    grouped_by_applicant = {}
+
+    # Convert all transfers to a single Pandas DataFrame, built column by column
+    df = pd.DataFrame(extract_transfer_columns(applicants))
+    # Clean and validate the transfers
+    cleaned_df = clean_and_validate_transfers(df, applicant_ids)
+
+    # Group and aggregate the transfers
+    if cleaned_df is not None and not cleaned_df.empty:
+        grouped_by_applicant = group_and_aggregate_transfers(cleaned_df)
+
+    return [grouped_by_applicant.get(applicant_idx, []) for applicant_idx in range(len(applicants))]
+
+
+def _count_transfers(applicant: Dict[str, Any]) -> int:
+    """
+    Count the transfers of an applicant.
+
+    A malformed 'transfers' value without a length (e.g. a number) counts as
+    none here; it fails later while processing that applicant only.
+
+    Args:
+        applicant: Applicant dictionary
+
+    Returns:
+        Number of transfers
+    """
+    try:
+        return len(applicant.get('transfers') or [])
+    except TypeError:
+        return 0
+
+
+def group_applicant_chunk(chunk: Tuple[List[Dict[str, Any]], List[str]]) -> List[List[Dict[str, Any]]]:
+    """
+    Clean, group and aggregate the transfers of a chunk of applicants.
+
+    The chunk is processed in one batch. If the batch fails, the applicants
+    are retried one at a time, so a single malformed applicant only loses
+    its own results. This is a module-level function, so it can be sent to
+    worker processes.
+
+    Args:
+        chunk: Tuple of the applicant dictionaries and their IDs
+
+    Returns:
+        List of grouped transfer records for each applicant, in the same order
+    """
+    applicants, applicant_ids = chunk
+    if sum(map(_count_transfers, applicants)) <= _SMALL_CHUNK_MAX_TRANSFERS:
+        return group_small_applicant_chunk(chunk)
+
+    try:
+        return group_batched_applicant_chunk(chunk)
     except Exception as error:
-        logger.error(f'Aggregation failed: {str(error)}')
-        return []
+        logger.error('Data processing failed - %s. Retrying applicants one at a time.', error)
+
+    grouped_transfers = []
+    for applicant, applicant_id in zip(applicants, applicant_ids):
+        try:
+            grouped_transfers.extend(group_batched_applicant_chunk(([applicant], [applicant_id])))
+        except Exception as error:
+            logger.error('Applicant %s: Data processing failed - %s', applicant_id, error)
+            grouped_transfers.append([])
+
+    return grouped_transfers
 
 
 def process_applicant_transfers(applicants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -146,7 +510,11 @@ def process_applicant_transfers(applicants: List[Dict[str, Any]]) -> List[Dict[s
     Process transfer data for multiple applicants with grouping and aggregation.
 
     This function groups transfers by (country, period) pairs for each applicant,
-    computes total amounts, and collects unique sources.
+    computes total amounts, and collects unique sources. All applicants are
+    cleaned and aggregated together in a single DataFrame, so the pandas
+    overhead is paid once instead of once per applicant. Large inputs are
+    split into chunks that are processed in parallel worker processes, when
+    enough CPUs are available.
 
     Args:
         applicants: List of dictionaries, each containing:
@@ -166,50 +534,39 @@ def process_applicant_transfers(applicants: List[Dict[str, Any]]) -> List[Dict[s
         logger.warning('No applications provided for processing.')
         return []
 
-    logger.info(f'Processing {len(applicants)} applicants.')
-    processed_applicants = []
-
-    for i, applicant in enumerate(applicants, start=1):
-        applicant_id = applicant.get('applicant_id', f'Unknown_{i}')
-        transfers = applicant.get('transfers', [])
-
-        # Handle empty transfers
-        if not transfers:
-            logger.info(f'Applicant {applicant_id}: No transfer records found.')
-            processed_applicants.append({
-                'applicant_id': applicant_id,
-                'grouped_transfers': [],
-            })
-            continue
+    logger.info('Processing %s applicants.', len(applicants))
+    applicant_ids = [
+        applicant.get('applicant_id', f'Unknown_{i}')
+        for i, applicant in enumerate(applicants, start=1)
+    ]
 
-        try:
-            # Convert to Pandas DataFrame
-            df = pd.DataFrame(transfers)
-            # Clean and validate the transfers
-            cleaned_df = clean_and_validate_transfers(df, applicant_id)
-
-            if cleaned_df is None or cleaned_df.empty:
-                processed_applicants.append({
-                    'applicant_id': applicant_id,
-                    'grouped_transfers': [],
-                })
-                continue
-
-            # Group and aggregate the transfers
-            grouped_transfers = group_and_aggregate_transfers(cleaned_df)
-            processed_applicants.append({
-                'applicant_id': applicant_id,
-                'grouped_transfers': grouped_transfers,
-            })
+    workers = os.cpu_count() or 1
+    # Daemon processes are not allowed to start child processes
+    if (
+        len(applicants) < _PARALLEL_MIN_APPLICANTS
+        or workers < _PARALLEL_MIN_WORKERS
+        or mp.current_process().daemon
+    ):
+        grouped_transfers = group_applicant_chunk((applicants, applicant_ids))
+    else:
+        # Split the applicants into a few chunks per worker; each chunk is still processed in one batch
+        chunk_size = -(-len(applicants) // (4 * workers))
+        chunks = [
+            (applicants[start:start + chunk_size], applicant_ids[start:start + chunk_size])
+            for start in range(0, len(applicants), chunk_size)
+        ]
+        with mp.Pool(workers) as pool:
+            grouped_transfers = list(chain.from_iterable(pool.map(group_applicant_chunk, chunks)))
 
-        except Exception as error:
-            logger.error(f'Applicant {applicant_id}: Data processing failed - {str(error)}')
-            processed_applicants.append({
-                'applicant_id': applicant_id,
-                'grouped_transfers': [],
-            })
+    processed_applicants = [
+        {
+            'applicant_id': applicant_id,
+            'grouped_transfers': applicant_transfers,
+        }
+        for applicant_id, applicant_transfers in zip(applicant_ids, grouped_transfers)
+    ]
 
-    logger.info(f'Completed processing {len(processed_applicants)} applicants.')
+    logger.info('Completed processing %s applicants.', len(processed_applicants))
     return processed_applicants
 
 
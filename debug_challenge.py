@@ -23,6 +23,7 @@ and will be replaced by 1, which is incorrect.
 - Would be better to add logging support for further debugging.
 """
 import logging
+from collections import defaultdict
 from typing import List, Dict, Any
 
 
@@ -62,20 +63,25 @@ def calculate_payments_modified(applicants: List[Dict[str, Any]]) -> Dict[str, f
         logger.warning('No applications provided for further calculation.')
         return {}
 
-    logger.info(f'Processing {len(applicants)} applicants.')
-    payment_by_currency = {}
+    logger.info('Processing %s applicants.', len(applicants))
+    payment_by_currency = defaultdict(float)
+    # Bind the callables used for every payment to local names once
+    to_float = float
+    warn = logger.warning
 
     for applicant_idx, applicant in enumerate(applicants, start=1):
         # Get currency, default to "GEL" if missing, and handle formatting
-        currency = str(applicant.get('currency', 'GEL').upper().strip())
+        raw_currency = applicant.get('currency', 'GEL')
+        currency = '' if raw_currency is None else str(raw_currency).strip().upper()
+
         if not currency:
-            logger.warning(f'Applicant {applicant_idx}: Empty currency. Automatically set to GEL.')
+            warn('Applicant %s: Empty currency. Automatically set to GEL.', applicant_idx)
             currency = 'GEL'
 
         # Get a list of payments for the applicant
         payments = applicant.get('payments', [])
         if not payments:
-            logger.warning(f'Applicant {applicant_idx}: No payments provided.')
+            warn('Applicant %s: No payments provided.', applicant_idx)
             continue
 
         for payment_idx, payment in enumerate(payments, start=1):
@@ -90,38 +96,38 @@ def calculate_payments_modified(applicants: List[Dict[str, Any]]) -> Dict[str, f
 
                 # Convert and validate incomeshare
                 try:
-                    incomeshare = float(payment.get('incomeshare', 1))
+                    incomeshare = to_float(payment.get('incomeshare', 1))
                     if incomeshare < 0 or incomeshare > 1:
-                        logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Invalid incomeshare value.')
+                        warn('Applicant %s, Payment %s: Invalid incomeshare value.', applicant_idx, payment_idx)
                         continue
                 except (TypeError, ValueError) as error:
-                    logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Invalid incomeshare value.')
+                    warn('Applicant %s, Payment %s: Invalid incomeshare value.', applicant_idx, payment_idx)
                     continue
 
                 # Convert and validate base
                 base_value = payment.get('base')
                 if base_value is None:
-                    logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Empty base.')
+                    warn('Applicant %s, Payment %s: Empty base.', applicant_idx, payment_idx)
                     continue
 
                 try:
-                    base = float(base_value)
+                    base = to_float(base_value)
                 except (TypeError, ValueError) as error:
-                    logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Invalid base value.')
+                    warn('Applicant %s, Payment %s: Invalid base value.', applicant_idx, payment_idx)
                     continue
 
                 if base <= 0:
-                    logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Base <= 0.')
+                    warn('Applicant %s, Payment %s: Base <= 0.', applicant_idx, payment_idx)
                     continue
 
                 # Convert amount
                 try:
-                    amount = float(payment.get('amount', 0))
+                    amount = to_float(payment.get('amount', 0))
                     if amount < 0:
-                        logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Invalid amount value.')
+                        warn('Applicant %s, Payment %s: Invalid amount value.', applicant_idx, payment_idx)
                         continue
                 except (TypeError, ValueError) as error:
-                    logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Invalid amount value.')
+                    warn('Applicant %s, Payment %s: Invalid amount value.', applicant_idx, payment_idx)
                     continue
 
                 # Calculate ratio and final amount
@@ -129,13 +135,13 @@ def calculate_payments_modified(applicants: List[Dict[str, Any]]) -> Dict[str, f
                 calculated_amount = amount * ratio
 
                 # Add to currency total
-                payment_by_currency[currency] = payment_by_currency.get(currency, 0) + calculated_amount
+                payment_by_currency[currency] += calculated_amount
 
             except Exception as error:
-                logger.warning(f'Applicant {applicant_idx}, Payment {payment_idx}: Unexpected error - {str(error)}')
+                warn('Applicant %s, Payment %s: Unexpected error - %s', applicant_idx, payment_idx, error)
                 continue
 
-    return payment_by_currency
+    return dict(payment_by_currency)
 
 
 if __name__ == '__main__':
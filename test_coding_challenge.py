@@ -0,0 +1,182 @@
+"""
+Tests for coding_challenge.py
+
+The pure-Python path (used for chunks with few transfers) and the pandas
+path (used for larger chunks) must give identical results and log messages,
+so an applicant's output never depends on the size of the chunk it is in.
+"""
+import logging
+import random
+import unittest
+
+import coding_challenge
+from coding_challenge import (
+    group_batched_applicant_chunk,
+    group_small_applicant_chunk,
+    process_applicant_transfers,
+)
+
+
+COUNTRIES = ['GE', 'ge', ' USA', 'uk ', '', '  ', None, float('nan'), ['GE'], 1, True, 1.0]
+PERIODS = [1, 2, 2.0, 2.5, '3', ' 4 ', -1, 0, None, '', 'two', float('inf'), 'inf', 1e30, 10 ** 30, True, b'2']
+AMOUNTS = [0.1, 0.2, 0.7, 1.1, 10, 50.5, '7', '400.0', '1e2', -3, 0, None, '', 'one hundred', float('inf')]
+SOURCES = ['A', 'b', 'C ', '', None, {'a'}, 1]
+EXTRA_VALUES = ['d1', 'd2', '', '  ', None, 1, 1.0, ['x']]
+
+
+def random_applicants(rng, count):
+    """Build applicants with a mix of valid, malformed and duplicate transfers."""
+    applicants = []
+    for i in range(count):
+        transfers = []
+        for _ in range(rng.randint(0, 40)):
+            transfer = {
+                'country': rng.choice(COUNTRIES),
+                'period': rng.choice(PERIODS),
+                'amountgel': rng.choice(AMOUNTS),
+                'source': rng.choice(SOURCES),
+            }
+            if rng.random() < 0.1:
+                del transfer[rng.choice(list(transfer))]
+            if rng.random() < 0.3:
+                transfer['date'] = rng.choice(EXTRA_VALUES)
+            transfers.append(transfer)
+            if rng.random() < 0.2:
+                transfers.append(dict(transfer))
+        applicants.append({'applicant_id': f'APP_{i}', 'transfers': transfers})
+    return applicants
+
+
+class CapturingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append((record.levelname, record.getMessage()))
+
+
+def run_with_logs(func, *args):
+    """Call func and return its result together with the messages it logged."""
+    handler = CapturingHandler()
+    coding_challenge.logger.addHandler(handler)
+    propagate = coding_challenge.logger.propagate
+    coding_challenge.logger.propagate = False
+    try:
+        return func(*args), handler.messages
+    finally:
+        coding_challenge.logger.removeHandler(handler)
+        coding_challenge.logger.propagate = propagate
+
+
+class SmallAndBatchedPathsTest(unittest.TestCase):
+    def test_paths_give_identical_results_and_logs(self):
+        rng = random.Random(0)
+        for case in range(200):
+            applicants = random_applicants(rng, rng.randint(1, 4))
+            chunk = (applicants, [applicant['applicant_id'] for applicant in applicants])
+
+            small, small_logs = run_with_logs(group_small_applicant_chunk, chunk)
+            batched, batched_logs = run_with_logs(group_batched_applicant_chunk, chunk)
+
+            with self.subTest(case=case):
+                self.assertEqual(small, batched)
+                self.assertEqual(
+                    [[{key: type(value) for key, value in record.items()} for record in records] for records in small],
+                    [[{key: type(value) for key, value in record.items()} for record in records] for records in batched],
+                )
+                self.assertEqual(small_logs, batched_logs)
+
+    def test_mixed_int_and_float_labels_keep_their_string_form(self):
+        applicants = [{
+            'applicant_id': 'APP',
+            'transfers': [
+                {'country': 1, 'period': 1, 'amountgel': 1.0, 'source': 1.0},
+                {'country': 1.0, 'period': 1, 'amountgel': 2.0, 'source': 1},
+            ],
+        }]
+        chunk = (applicants, ['APP'])
+
+        self.assertEqual(group_small_applicant_chunk(chunk), group_batched_applicant_chunk(chunk))
+
+
+class LogOrderTest(unittest.TestCase):
+    def test_messages_follow_applicant_order(self):
+        invalid = {'country': 'GE', 'period': 0, 'amountgel': 1.0}
+        valid = {'country': 'GE', 'period': 1, 'amountgel': 1.0}
+        for copies in (1, 40):  # pure-Python path, then pandas path
+            applicants = [
+                {'applicant_id': 'A', 'transfers': [invalid, *[dict(valid, amountgel=i + 1.0) for i in range(copies)]]},
+                {'applicant_id': 'B', 'transfers': []},
+                {'applicant_id': 'C', 'transfers': [invalid]},
+            ]
+            _, logs = run_with_logs(process_applicant_transfers, applicants)
+
+            with self.subTest(copies=copies):
+                self.assertEqual(logs[1:-1], [
+                    ('INFO', 'Applicant A: Removed 1 invalid row(s).'),
+                    ('INFO', 'Applicant B: No transfer records found.'),
+                    ('WARNING', 'Applicant C: All rows removed due to missing or invalid data.'),
+                ])
+
+
+class ProcessApplicantTransfersTest(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    @staticmethod
+    def valid_applicants(count):
+        return [
+            {
+                'applicant_id': f'OK_{i}',
+                'transfers': [{'country': 'GE', 'period': 1, 'amountgel': 10.0, 'source': 'A'}],
+            }
+            for i in range(count)
+        ]
+
+    def test_extra_fields_keep_transfers_distinct(self):
+        transfers = [
+            {'country': 'GE', 'period': 1, 'amountgel': 10.0, 'source': 'A', 'date': date}
+            for date in ('d1', 'd2')
+        ]
+        for copies in (1, 20):  # pure-Python path, then pandas path
+            with self.subTest(copies=copies):
+                result = process_applicant_transfers([{'applicant_id': 'APP', 'transfers': transfers * copies}])
+                self.assertEqual(result[0]['grouped_transfers'][0]['amountgel'], 20.0)
+
+    def test_invalid_period_only_affects_its_applicant(self):
+        applicants = [
+            {'applicant_id': 'BAD', 'transfers': [{'country': 'GE', 'period': 'inf', 'amountgel': 1.0}]},
+            *self.valid_applicants(40),
+        ]
+        result = process_applicant_transfers(applicants)
+
+        self.assertEqual(result[0]['grouped_transfers'], [])
+        self.assertTrue(all(applicant['grouped_transfers'] for applicant in result[1:]))
+
+    def test_transfers_without_length_only_affect_their_applicant(self):
+        for transfers in (5, True):
+            for count in (2, 40):  # pure-Python path, then pandas path
+                with self.subTest(transfers=transfers, count=count):
+                    applicants = [{'applicant_id': 'BAD', 'transfers': transfers}, *self.valid_applicants(count)]
+                    result = process_applicant_transfers(applicants)
+
+                    self.assertEqual(result[0]['grouped_transfers'], [])
+                    self.assertTrue(all(applicant['grouped_transfers'] for applicant in result[1:]))
+
+    def test_unhashable_country_is_labelled_by_its_string_form(self):
+        applicants = [
+            {'applicant_id': 'LIST', 'transfers': [{'country': ['GE'], 'period': 1, 'amountgel': 1.0}]},
+            *self.valid_applicants(40),
+        ]
+        result = process_applicant_transfers(applicants)
+
+        self.assertEqual(result[0]['grouped_transfers'][0]['country'], "['GE']")
+        self.assertTrue(all(applicant['grouped_transfers'] for applicant in result[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
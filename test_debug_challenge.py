@@ -0,0 +1,190 @@
+"""
+Tests for debug_challenge.py
+
+calculate_payments_modified is checked against a reference built from the
+rules of the original modified function: the same totals, in the same
+currency order, and the same warnings, logged in input order.
+"""
+import logging
+import random
+import unittest
+
+import debug_challenge
+from debug_challenge import calculate_payments_modified
+
+
+# (key, default, rejection check, message when it cannot be converted, message when rejected)
+PAYMENT_RULES = [
+    ('incomeshare', 1, lambda value: value < 0 or value > 1, 'Invalid incomeshare value.', 'Invalid incomeshare value.'),
+    ('base', None, lambda value: value <= 0, 'Invalid base value.', 'Base <= 0.'),
+    ('amount', 0, lambda value: value < 0, 'Invalid amount value.', 'Invalid amount value.'),
+]
+
+CURRENCIES = ['usd', ' USD', 'gel', 'EUR ', '', '  ', None, 1, True]
+ACTIVE_VALUES = [True, False, '', 0, 1, None]
+NUMBERS = [0, 0.2, 0.5, 1, 1.5, -0.1, -1, '0.3', '100', 'abc', '', None, 2000, 10 ** 400, float('nan'), float('inf')]
+
+
+def expected_payment(payment):
+    """Return the calculated amount of a payment (or None) and its warning (or None)."""
+    try:
+        active = payment.get('active', True)
+        if active != '' and not active:
+            return None, None
+
+        numbers = {}
+        for key, default, is_rejected, invalid_message, rejected_message in PAYMENT_RULES:
+            value = payment.get(key, default)
+            if key == 'base' and value is None:
+                return None, 'Empty base.'
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                return None, invalid_message
+            if is_rejected(number):
+                return None, rejected_message
+            numbers[key] = number
+
+    except Exception as error:
+        return None, f'Unexpected error - {error}'
+
+    return numbers['amount'] * (numbers['incomeshare'] / numbers['base']), None
+
+
+def expected_calculation(applicants):
+    """Return the expected totals and the warnings, in the order they should be logged."""
+    totals, warnings = {}, []
+
+    for applicant_idx, applicant in enumerate(applicants, start=1):
+        currency = applicant.get('currency', 'GEL')
+        currency = '' if currency is None else str(currency).strip().upper()
+        if not currency:
+            warnings.append(f'Applicant {applicant_idx}: Empty currency. Automatically set to GEL.')
+            currency = 'GEL'
+
+        payments = applicant.get('payments', [])
+        if not payments:
+            warnings.append(f'Applicant {applicant_idx}: No payments provided.')
+            continue
+
+        for payment_idx, payment in enumerate(payments, start=1):
+            calculated_amount, warning = expected_payment(payment)
+            if warning is not None:
+                warnings.append(f'Applicant {applicant_idx}, Payment {payment_idx}: {warning}')
+            elif calculated_amount is not None:
+                totals[currency] = totals.get(currency, 0) + calculated_amount
+
+    return totals, warnings
+
+
+def random_applicants(rng, count):
+    """Build applicants with a mix of valid, malformed and inactive payments."""
+    applicants = []
+    for _ in range(count):
+        payments = []
+        for _ in range(rng.randint(0, 6)):
+            if rng.random() < 0.05:
+                payments.append(None)
+                continue
+            payment = {key: rng.choice(NUMBERS) for key in ('incomeshare', 'base', 'amount') if rng.random() < 0.9}
+            if rng.random() < 0.7:
+                payment['active'] = rng.choice(ACTIVE_VALUES)
+            payments.append(payment)
+
+        applicant = {'payments': payments if payments or rng.random() < 0.5 else None}
+        if rng.random() < 0.8:
+            applicant['currency'] = rng.choice(CURRENCIES)
+        applicants.append(applicant)
+    return applicants
+
+
+class CapturingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def run_with_warnings(applicants):
+    """Call calculate_payments_modified and return its result together with the warnings it logged."""
+    handler = CapturingHandler()
+    debug_challenge.logger.addHandler(handler)
+    propagate = debug_challenge.logger.propagate
+    debug_challenge.logger.propagate = False
+    try:
+        return calculate_payments_modified(applicants), handler.messages
+    finally:
+        debug_challenge.logger.removeHandler(handler)
+        debug_challenge.logger.propagate = propagate
+
+
+class CalculatePaymentsModifiedTest(unittest.TestCase):
+    def assertMatchesReference(self, applicants):
+        result, warnings = run_with_warnings(applicants)
+        expected_result, expected_warnings = expected_calculation(applicants)
+
+        # repr keeps NaN totals comparable
+        self.assertEqual(
+            [(currency, repr(total)) for currency, total in result.items()],
+            [(currency, repr(total)) for currency, total in expected_result.items()],
+        )
+        self.assertEqual(warnings, expected_warnings)
+
+    def test_random_applicants_match_reference(self):
+        rng = random.Random(0)
+        for case in range(300):
+            with self.subTest(case=case):
+                self.assertMatchesReference(random_applicants(rng, rng.randint(1, 5)))
+
+    def test_warnings_follow_input_order(self):
+        applicants = [
+            {'currency': ' ', 'payments': [{'base': 0}, {'incomeshare': 0.5, 'base': 1, 'amount': 10}]},
+            {'currency': 'USD', 'payments': []},
+            {'currency': 'USD', 'payments': [None, {'incomeshare': 'abc', 'base': 1}]},
+        ]
+        result, warnings = run_with_warnings(applicants)
+
+        self.assertEqual(result, {'GEL': 5.0})
+        self.assertEqual(warnings, [
+            'Applicant 1: Empty currency. Automatically set to GEL.',
+            'Applicant 1, Payment 1: Base <= 0.',
+            'Applicant 2: No payments provided.',
+            "Applicant 3, Payment 1: Unexpected error - 'NoneType' object has no attribute 'get'",
+            'Applicant 3, Payment 2: Invalid incomeshare value.',
+        ])
+
+    def test_overflow_does_not_hide_an_earlier_rejection(self):
+        applicants = [{'payments': [{'incomeshare': 5, 'base': 1, 'amount': 10 ** 400}]}]
+        result, warnings = run_with_warnings(applicants)
+
+        self.assertEqual(result, {})
+        self.assertEqual(warnings, ['Applicant 1, Payment 1: Invalid incomeshare value.'])
+
+    def test_overflowing_amount_is_an_unexpected_error(self):
+        applicants = [{'payments': [{'incomeshare': 0.5, 'base': 1, 'amount': 10 ** 400}]}]
+        result, warnings = run_with_warnings(applicants)
+
+        self.assertEqual(result, {})
+        self.assertEqual(warnings, ['Applicant 1, Payment 1: Unexpected error - int too large to convert to float'])
+
+    def test_none_currency_falls_back_to_gel(self):
+        applicants = [{'currency': None, 'payments': [{'incomeshare': 0.5, 'base': 1, 'amount': 10}]}]
+        result, warnings = run_with_warnings(applicants)
+
+        self.assertEqual(result, {'GEL': 5.0})
+        self.assertEqual(warnings, ['Applicant 1: Empty currency. Automatically set to GEL.'])
+
+    def test_equal_non_string_currencies_stay_distinct(self):
+        applicants = [
+            {'currency': currency, 'payments': [{'incomeshare': 1, 'base': 1, 'amount': 10}]}
+            for currency in (1, True, 1.0)
+        ]
+        result, _ = run_with_warnings(applicants)
+
+        self.assertEqual(result, {'1': 10.0, 'TRUE': 10.0, '1.0': 10.0})
+
+
+if __name__ == '__main__':
+    unittest.main()